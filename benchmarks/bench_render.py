@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Benchmark the Rich table path against the plain tab-delimited path.
+
+Both renderers write into an in-memory buffer so terminal speed does
+not skew the comparison.
+
+Usage:
+    python benchmarks/bench_render.py [--rows N]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rich.console import Console
+from rich.table import Table
+
+from main import TASK_COLUMNS, write_plain
+
+
+def make_rows(count):
+    """Build formatted task rows like task_rows() produces."""
+    return [
+        [str(i), f"task number {i}", f"user{i % 500}",
+         "completed" if i % 3 == 0 else "pending", str(i % 1000 + 1)]
+        for i in range(1, count + 1)
+    ]
+
+
+def render_rich(rows):
+    console = Console(file=io.StringIO(), width=120, force_terminal=True)
+    table = Table(title="Tasks")
+    table.add_column(TASK_COLUMNS[0], justify="right")
+    for column in TASK_COLUMNS[1:]:
+        table.add_column(column)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def render_plain(rows):
+    write_plain(TASK_COLUMNS, rows, io.StringIO())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"rows={args.rows}")
+    for label, render in (("rich", render_rich), ("plain", render_plain)):
+        start = time.perf_counter()
+        render(rows)
+        print(f"{label:>6}: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
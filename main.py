@@ -10,143 +10,292 @@ CLI entry point for the User/Project/Task management system.
 Provides commands for creating and listing Users, Projects, and Tasks,
 as well as marking tasks as completed. Uses argparse for command-line
 parsing, Rich for formatted output, and JSON utilities for persistence.
+
+`main(argv, store=...)` can also be called in-process: pass a loaded
+Store to reuse it across calls instead of re-reading the JSON files.
 """
 
 import argparse
+import json
+import sys
 from rich.table import Table
 from rich.console import Console
 
+from models.store import DATA_DIR, Store
 from models.user import User
 from models.project import Project
 from models.task import Task
-from utils.storage import load_all, save_all
+from utils.storage import DataFileError, StaleStoreError, ensure_loaded, save_all
+from utils.cache import get_cached_rows, put_cached_rows
 from utils.helpers import find_user_or_error, find_project_or_error
+from utils.export import EXPORT_FORMATS, export_store
+from utils.integrity import check_store_files
+from utils.events import events_path, follow_events
 
 # Shared console instance for Rich output
 console = Console()
 
 
+# -------------------- ROW BUILDERS --------------------
+# Rows are lists of already-formatted strings so they can be cached as JSON.
+def user_rows(store):
+    """Return one formatted row per user."""
+    return [
+        [str(u.id), u.name, u.email, str(len(u.projects))]
+        for u in User.get_all(store)
+    ]
+
+
+def project_rows(store):
+    """Return one formatted row per project."""
+    return [
+        [str(p.id), p.title, str(p.user_id), p.due_date, str(len(p.tasks))]
+        for p in Project.get_all(store)
+    ]
+
+
+def task_row(t):
+    """Format a single task as a row."""
+    return [str(t.id), t.title, t.assigned_to, t.status, str(t.project_id)]
+
+
+def task_rows(store):
+    """Return one formatted row per task."""
+    return [task_row(t) for t in Task.get_all(store)]
+
+
+def workload_rows(store):
+    """Return open and completed task counts per assignee."""
+    return [
+        [assignee, str(pending), str(completed)]
+        for assignee, pending, completed in store.workload()
+    ]
+
+
+def cached_rows(args, build_rows, params=None):
+    """
+    Return rows for a list/query command, using the result cache.
+
+    On a hit neither the models nor the rows are rebuilt; on a miss the
+    store is loaded, the rows are built and then cached. A store that is
+    already loaded skips the cache: its rows come from memory anyway, and
+    it may hold changes that have not been saved (and stamped) yet.
+    """
+    store = args.store
+    if store.loaded:
+        ensure_loaded(store)  # pick up other writers' saves
+        return build_rows(store)
+
+    params = params or {}
+    rows = get_cached_rows(store, args.command, params)
+    if rows is None:
+        ensure_loaded(store)
+        rows = build_rows(store)
+        put_cached_rows(store, args.command, params, rows)
+    return rows
+
+
 # -------------------- DISPLAY HELPERS --------------------
-def show_users():
-    """Render all users in a formatted table."""
-    table = Table(title="Users")
-    table.add_column("ID", justify="right")
-    table.add_column("Name")
-    table.add_column("Email")
-    table.add_column("Projects")
+# Column headers for each listing; the first (ID) column is right-justified
+USER_COLUMNS = ["ID", "Name", "Email", "Projects"]
+PROJECT_COLUMNS = ["ID", "Title", "User ID", "Due Date", "Tasks"]
+TASK_COLUMNS = ["ID", "Title", "Assigned To", "Status", "Project ID"]
+WORKLOAD_COLUMNS = ["Assigned To", "Open", "Completed"]
 
-    for u in User.get_all():
-        table.add_row(str(u.id), u.name, u.email, str(len(u.projects)))
+# Characters that would break the plain tab-delimited layout
+_PLAIN_ESCAPES = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
 
-    console.print(table)
 
+def use_plain_output(args):
+    """Plain rows for --plain, or whenever stdout is not a terminal."""
+    return getattr(args, "plain", False) or not console.is_terminal
 
-def show_projects():
-    """Render all projects in a formatted table."""
-    table = Table(title="Projects")
-    table.add_column("ID", justify="right")
-    table.add_column("Title")
-    table.add_column("User ID")
-    table.add_column("Due Date")
-    table.add_column("Tasks")
-
-    for p in Project.get_all():
-        table.add_row(
-            str(p.id),
-            p.title,
-            str(p.user_id),
-            p.due_date,
-            str(len(p.tasks)),
-        )
 
-    console.print(table)
+def write_plain(columns, rows, stream=None):
+    """
+    Write a header and one tab-delimited line per row.
+
+    Skips Rich's width measuring and wrapping entirely, which matters
+    for large listings piped to other tools or log files.
+    """
+    stream = stream or sys.stdout
+    stream.write("\t".join(columns) + "\n")
+    stream.writelines(
+        "\t".join(field.translate(_PLAIN_ESCAPES) for field in row) + "\n"
+        for row in rows
+    )
+    stream.flush()
+
+
+def show_table(title, columns, rows, plain=False):
+    """Render rows as a Rich table, or as plain delimited text."""
+    if plain:
+        write_plain(columns, rows)
+        return
 
+    table = Table(title=title)
+    table.add_column(columns[0], justify="right")
+    for column in columns[1:]:
+        table.add_column(column)
 
-def show_tasks():
-    """Render all tasks in a formatted table."""
-    table = Table(title="Tasks")
-    table.add_column("ID", justify="right")
-    table.add_column("Title")
-    table.add_column("Assigned To")
-    table.add_column("Status")
-    table.add_column("Project ID")
-
-    for t in Task.get_all():
-        table.add_row(
-            str(t.id),
-            t.title,
-            t.assigned_to,
-            t.status,
-            str(t.project_id),
-        )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
 
+def show_users(rows, plain=False):
+    """Render user rows in a formatted table."""
+    show_table("Users", USER_COLUMNS, rows, plain)
+
+
+def show_projects(rows, plain=False):
+    """Render project rows in a formatted table."""
+    show_table("Projects", PROJECT_COLUMNS, rows, plain)
+
+
+def show_tasks(rows, plain=False, title="Tasks"):
+    """Render task rows in a formatted table."""
+    show_table(title, TASK_COLUMNS, rows, plain)
+
+
+def show_workload(rows, plain=False):
+    """Render per-assignee task counts in a formatted table."""
+    show_table("Workload", WORKLOAD_COLUMNS, rows, plain)
+
+
 # -------------------- COMMAND FUNCTIONS --------------------
 def command_add_user(args):
     """Create a new user and save data."""
-    User.create(args.name, args.email)
-    save_all()  # persist new state to JSON
+    User.create(args.name, args.email, store=args.store)
+    save_all(args.store)  # persist new state to JSON
     console.print(f"[bold green]User created:[/] {args.name}")
 
 
 def command_list_users(args):
     """List all users."""
-    show_users()
+    show_users(cached_rows(args, user_rows), use_plain_output(args))
 
 
 def command_add_project(args):
     """Create a project only if the user exists."""
     # Use helper for clean lookup and error handling
-    user = find_user_or_error(args.user_id, console)
+    user = find_user_or_error(args.user_id, console, store=args.store)
     if not user:
         return
 
-    Project.create(args.title, args.description, args.due, args.user_id)
-    save_all()
+    Project.create(args.title, args.description, args.due, args.user_id, store=args.store)
+    save_all(args.store)
     console.print(f"[bold green]Project created:[/] {args.title}")
 
 
 def command_list_projects(args):
     """List all projects."""
-    show_projects()
+    show_projects(cached_rows(args, project_rows), use_plain_output(args))
 
 
 def command_add_task(args):
     """Create a task only if the project exists."""
-    project = find_project_or_error(args.project_id, console)
+    project = find_project_or_error(args.project_id, console, store=args.store)
     if not project:
         return
 
-    Task.create(args.title, args.assigned_to, args.project_id)
-    save_all()
+    Task.create(args.title, args.assigned_to, args.project_id, store=args.store)
+    save_all(args.store)
     console.print(f"[bold green]Task created:[/] {args.title}")
 
 
 def command_list_tasks(args):
     """List all tasks."""
-    show_tasks()
+    show_tasks(cached_rows(args, task_rows), use_plain_output(args))
+
+
+def command_my_tasks(args):
+    """List one assignee's tasks using the assignee index."""
+    status = None if args.status == "all" else args.status
+
+    def build_rows(store):
+        tasks = Task.get_by_assignee(args.assigned_to, status, store=store)
+        return [task_row(t) for t in tasks]
+
+    params = {"assigned_to": args.assigned_to, "status": args.status}
+    rows = cached_rows(args, build_rows, params)
+    show_tasks(rows, use_plain_output(args), title=f"Tasks for {args.assigned_to}")
+
+
+def command_workload(args):
+    """Summarize open and completed tasks per assignee."""
+    show_workload(cached_rows(args, workload_rows), use_plain_output(args))
 
 
 def command_complete_task(args):
     """Mark a task complete if it exists."""
-    task = Task.get_by_id(args.task_id)
+    task = Task.get_by_id(args.task_id, store=args.store)
     if not task:
         console.print(f"[bold red]Error: No task found with ID {args.task_id}[/]")
         return
 
+    if task.status == "completed":
+        console.print(f"[bold yellow]Task already complete:[/] {task.title}")
+        return
+
     task.mark_complete()
-    save_all()
+    save_all(args.store)
     console.print(f"[bold green]Task marked complete:[/] {task.title}")
 
 
+def command_export(args):
+    """Stream every task, joined with its project and user, to a file or stdout."""
+    compress = args.gzip or (args.output or "").endswith(".gz")
+    count = export_store(args.store, args.format, args.output, compress)
+
+    # Only report when the rows did not go to stdout
+    if args.output not in (None, "-"):
+        console.print(f"[bold green]Exported {count} rows to:[/] {args.output}")
+
+
+def command_watch(args):
+    """Stream change events as JSON lines, optionally following new ones."""
+    events = follow_events(
+        events_path(args.store),
+        since=args.since,
+        follow=not args.no_follow,
+        interval=args.interval,
+    )
+    try:
+        for event in events:
+            sys.stdout.write(json.dumps(event, separators=(",", ":")) + "\n")
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass  # Ctrl+C is the normal way to stop following
+
+
+def command_fsck(args):
+    """Check the data files for duplicate IDs and orphaned records."""
+    problems = check_store_files(args.store)
+    if not problems:
+        console.print("[bold green]No problems found.[/]")
+        return
+
+    for problem in problems:
+        console.print(f"[bold red]Error: {problem}[/]")
+    sys.exit(1)
+
+
 # -------------------- MAIN CLI SETUP --------------------
+PLAIN_HELP = "Write tab-delimited rows instead of a table (default when not a TTY)"
+
+
 def build_parser():
     """Define all CLI commands and arguments."""
     parser = argparse.ArgumentParser(
         description="User/Project/Task Management CLI"
     )
+    parser.add_argument(
+        "--data-dir",
+        default=DATA_DIR,
+        help="Directory holding the JSON data files",
+    )
     # Subparsers are used to define each subcommand (add-user, list-users, etc.)
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -157,7 +306,8 @@ def build_parser():
     add_user.set_defaults(func=command_add_user)
 
     list_users = subparsers.add_parser("list-users", help="List all users")
-    list_users.set_defaults(func=command_list_users)
+    list_users.add_argument("--plain", action="store_true", help=PLAIN_HELP)
+    list_users.set_defaults(func=command_list_users, lazy=True)
 
     # ---- PROJECTS ----
     add_project = subparsers.add_parser("add-project", help="Create a new project")
@@ -168,7 +318,8 @@ def build_parser():
     add_project.set_defaults(func=command_add_project)
 
     list_projects = subparsers.add_parser("list-projects", help="List all projects")
-    list_projects.set_defaults(func=command_list_projects)
+    list_projects.add_argument("--plain", action="store_true", help=PLAIN_HELP)
+    list_projects.set_defaults(func=command_list_projects, lazy=True)
 
     # ---- TASKS ----
     add_task = subparsers.add_parser("add-task", help="Create a new task")
@@ -178,7 +329,8 @@ def build_parser():
     add_task.set_defaults(func=command_add_task)
 
     list_tasks = subparsers.add_parser("list-tasks", help="List all tasks")
-    list_tasks.set_defaults(func=command_list_tasks)
+    list_tasks.add_argument("--plain", action="store_true", help=PLAIN_HELP)
+    list_tasks.set_defaults(func=command_list_tasks, lazy=True)
 
     complete_task = subparsers.add_parser(
         "complete-task",
@@ -187,19 +339,96 @@ def build_parser():
     complete_task.add_argument("--task-id", type=int, required=True)
     complete_task.set_defaults(func=command_complete_task)
 
+    my_tasks = subparsers.add_parser("my-tasks", help="List tasks for one assignee")
+    my_tasks.add_argument("--assigned-to", required=True)
+    my_tasks.add_argument(
+        "--status",
+        choices=["pending", "completed", "all"],
+        default="pending",
+    )
+    my_tasks.add_argument("--plain", action="store_true", help=PLAIN_HELP)
+    my_tasks.set_defaults(func=command_my_tasks, lazy=True)
+
+    workload = subparsers.add_parser(
+        "workload",
+        help="Show open and completed task counts per assignee",
+    )
+    workload.add_argument("--plain", action="store_true", help=PLAIN_HELP)
+    workload.set_defaults(func=command_workload, lazy=True)
+
+    # ---- EXPORT ----
+    export = subparsers.add_parser(
+        "export",
+        help="Export tasks joined with projects and users",
+    )
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="jsonl")
+    export.add_argument("--output", default="-", help="File path, or - for stdout")
+    export.add_argument("--gzip", action="store_true", help="Gzip-compress the output")
+    export.set_defaults(func=command_export)
+
+    # ---- CHANGE FEED ----
+    watch = subparsers.add_parser(
+        "watch",
+        help="Stream change events as JSON lines",
+    )
+    watch.add_argument("--since", type=int, default=0, help="Only events after this sequence number")
+    watch.add_argument("--no-follow", action="store_true", help="Exit after the existing events")
+    watch.add_argument("--interval", type=float, default=0.5, help="Seconds between polls")
+    watch.set_defaults(func=command_watch, uses_store=False)
+
+    # ---- MAINTENANCE ----
+    fsck = subparsers.add_parser(
+        "fsck",
+        help="Check data files for duplicate IDs and orphaned records",
+    )
+    fsck.set_defaults(func=command_fsck, lazy=True)
+
     return parser
 
 
-def main():
-    """Load data, process CLI arguments, and execute commands."""
-    # Load JSON data at startup so previous state is restored
-    load_all()
+def main(argv=None, store=None):
+    """
+    Load data, process CLI arguments, and execute commands.
 
+    `argv` defaults to sys.argv. When a `store` is given it is used as-is
+    (and loaded on first use); otherwise a new Store is created for
+    `--data-dir`. Returns the store so callers can keep reusing it.
+    """
     parser = build_parser()
-    args = parser.parse_args()
-
-    # Each subcommand sets a `func` attribute which we call here
-    args.func(args)
+    args = parser.parse_args(argv)
+
+    if store is None:
+        store = Store(args.data_dir)
+    args.store = store
+
+    # `watch` only tails the events file and may run forever, so it must
+    # not hold the store lock and block every other command on the store
+    if not getattr(args, "uses_store", True):
+        args.func(args)
+        return store
+
+    # Hold the store lock so concurrent in-process calls don't interleave
+    with store.lock:
+        try:
+            # Load JSON data on first use so previous state is restored.
+            # Lazy commands load it themselves, if at all (e.g. on a cache miss).
+            if not getattr(args, "lazy", False):
+                ensure_loaded(store)
+
+            # Each subcommand sets a `func` attribute which we call here
+            args.func(args)
+        except DataFileError as error:
+            # Stop before anything is saved over the damaged file
+            console.print(f"[bold red]Error: {error}[/]")
+            console.print("Run `fsck` to check the data files.")
+            sys.exit(1)
+        except StaleStoreError as error:
+            # Drop the unsaved change; the next command reloads fresh data
+            store.loaded = False
+            console.print(f"[bold red]Error: {error}[/]")
+            sys.exit(1)
+
+    return store
 
 
 if __name__ == "__main__":
@@ -7,22 +7,18 @@
 Project model definition.
 
 Represents a project owned by a specific User and containing multiple
-Tasks. Includes class-level storage, ID generation, controlled attribute
+Tasks. Includes store registration, ID generation, controlled attribute
 access, relationship management, and JSON serialization helpers.
 """
 
+from models.store import get_default_store
 from models.user import User
 
 
 class Project:
-    # Class-wide ID counter and storage list
-    _id_counter = 1
-    _projects = []
-
-    def __init__(self, title: str, description: str, due_date: str, user_id: int):
-        # Unique ID
-        self.id = Project._id_counter
-        Project._id_counter += 1
+    def __init__(self, title: str, description: str, due_date: str, user_id: int, store=None):
+        # The store that owns this project (process default if not given)
+        self._store = store or get_default_store()
 
         # Controlled attributes
         self.title = title
@@ -33,14 +29,14 @@ class Project:
         self.user_id = user_id
         self.tasks = []  # one-to-many relationship: Project → Tasks
 
+        # Register with the store, which assigns the unique ID
+        self._store.add("projects", self)
+
         # Add project to user (if user exists)
-        user = User.get_by_id(user_id)
+        user = User.get_by_id(user_id, store=self._store)
         if user:
             user.add_project(self)
 
-        # Store this instance in the class-level list
-        Project._projects.append(self)
-
     # -------------------- PROPERTIES --------------------
     @property
     def title(self):
@@ -80,39 +76,42 @@ class Project:
     # -------------------- SERIALIZATION --------------------
     def to_dict(self):
         """Convert this project into a serializable dict."""
+        # tasks are relinked from each Task's project_id on load
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
             "due_date": self.due_date,
             "user_id": self.user_id,
-            "tasks": [t.id for t in self.tasks],
         }
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict, store=None):
         """Rebuild a Project instance from stored data."""
         project = cls(
             data["title"],
             data["description"],
             data["due_date"],
-            data["user_id"]
+            data["user_id"],
+            store=store,
         )
-        project.id = data["id"]  # keep original ID
+        project._store.restore_id("projects", project, data["id"])  # keep original ID
         return project
 
     # -------------------- CLASS METHODS --------------------
     @classmethod
-    def get_all(cls):
-        return cls._projects
+    def get_all(cls, store=None):
+        return (store or get_default_store()).all("projects")
 
     @classmethod
-    def get_by_id(cls, project_id: int):
-        return next((p for p in cls._projects if p.id == project_id), None)
+    def get_by_id(cls, project_id: int, store=None):
+        return (store or get_default_store()).get("projects", project_id)
 
     @classmethod
-    def create(cls, title, description, due_date, user_id):
-        return cls(title, description, due_date, user_id)
+    def create(cls, title, description, due_date, user_id, store=None):
+        project = cls(title, description, due_date, user_id, store=store)
+        project._store.emit("project.created", project.to_dict())
+        return project
 
     # -------------------- STRING REPRESENTATION --------------------
     def __repr__(self):
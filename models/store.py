@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Store definition.
+
+A Store owns the Users, Projects, and Tasks that belong to one data
+directory, together with their ID counters and lookup indexes (by ID,
+and tasks by assignee and status). Several stores can live in the same
+process, and a reentrant lock lets a store be shared safely between
+threads (for example inside a long-running worker that calls
+`main(argv, store=...)` directly).
+"""
+
+import threading
+
+# Default location of the JSON files, relative to the working directory
+DATA_DIR = "data"
+
+# Collection names used as keys for counters and indexes
+KINDS = ("users", "projects", "tasks")
+
+# Task statuses tracked by the assignee index
+TASK_STATUSES = ("pending", "completed")
+
+
+class Store:
+    def __init__(self, data_dir: str = DATA_DIR):
+        self.data_dir = data_dir
+        self.lock = threading.RLock()
+        self.loaded = False  # set by utils.storage.load_all
+        self.generation = 0  # bumped by every utils.storage.save_all
+        self.event_seq = 0  # sequence number of the last saved change event
+        self.dirty = False  # unsaved changes made since the last load/save
+        self.reset()
+
+    def reset(self):
+        """Drop every object and restart all ID counters."""
+        with self.lock:
+            self._items = {kind: [] for kind in KINDS}
+            self._index = {kind: {} for kind in KINDS}
+            self._next_ids = {kind: 1 for kind in KINDS}
+            # assignee -> status -> task IDs (dicts keep insertion order)
+            self._assignees = {}
+            # change events waiting for the next save (see emit)
+            self.pending_events = []
+
+    # -------------------- REGISTRATION --------------------
+    def add(self, kind: str, obj):
+        """Assign the next ID of `kind` to obj and store it."""
+        with self.lock:
+            obj.id = self._next_ids[kind]
+            self._next_ids[kind] += 1
+            self._items[kind].append(obj)
+            self._index[kind][obj.id] = obj
+            if kind == "tasks":
+                self._index_assignee(obj)
+            self.dirty = True
+            return obj
+
+    def restore_id(self, kind: str, obj, obj_id: int):
+        """Give a stored object back its saved ID (used when loading)."""
+        with self.lock:
+            index = self._index[kind]
+            if index.get(obj.id) is obj:
+                del index[obj.id]
+                if kind == "tasks":
+                    self._unindex_assignee(obj.id, obj.assigned_to, obj.status)
+            obj.id = obj_id
+            index[obj_id] = obj
+            if kind == "tasks":
+                self._index_assignee(obj)
+            # maintain highest ID so new objects never collide
+            if obj_id >= self._next_ids[kind]:
+                self._next_ids[kind] = obj_id + 1
+
+    # -------------------- CHANGE EVENTS --------------------
+    def emit(self, event: str, data: dict):
+        """
+        Queue a change event for this store.
+
+        Events are numbered and appended to the events file by
+        utils.storage.save_all, so they only appear once the change
+        itself has been written.
+        """
+        with self.lock:
+            self.pending_events.append({"event": event, "data": data})
+
+    # -------------------- ASSIGNEE INDEX --------------------
+    def _index_assignee(self, task):
+        buckets = self._assignees.setdefault(
+            task.assigned_to, {status: {} for status in TASK_STATUSES}
+        )
+        buckets[task.status][task.id] = None
+
+    def _unindex_assignee(self, task_id: int, assignee: str, status: str):
+        buckets = self._assignees.get(assignee)
+        if buckets:
+            buckets[status].pop(task_id, None)
+            # forget assignees with no tasks left
+            if not any(buckets.values()):
+                del self._assignees[assignee]
+
+    def reindex_task(self, task, old_assignee: str, old_status: str):
+        """Move a task whose assignee or status changed in the assignee index."""
+        with self.lock:
+            self._unindex_assignee(task.id, old_assignee, old_status)
+            self._index_assignee(task)
+            self.dirty = True
+
+    # -------------------- LOOKUPS --------------------
+    # Lookups hold the lock and return copies, so callers on other threads
+    # never iterate a collection while it is being modified.
+    def all(self, kind: str):
+        with self.lock:
+            return list(self._items[kind])
+
+    def get(self, kind: str, obj_id: int):
+        with self.lock:
+            return self._index[kind].get(obj_id)
+
+    def tasks_for_assignee(self, assignee: str, status: str = None):
+        """Return an assignee's tasks, optionally only those with `status`."""
+        with self.lock:
+            buckets = self._assignees.get(assignee, {})
+            statuses = [status] if status else TASK_STATUSES
+            index = self._index["tasks"]
+            return [index[task_id] for s in statuses for task_id in buckets.get(s, ())]
+
+    def workload(self):
+        """Return (assignee, pending count, completed count) sorted by assignee."""
+        with self.lock:
+            return [
+                (assignee, len(buckets["pending"]), len(buckets["completed"]))
+                for assignee, buckets in sorted(self._assignees.items())
+            ]
+
+    def __repr__(self):
+        counts = ", ".join(f"{kind}={len(self._items[kind])}" for kind in KINDS)
+        return f"Store(data_dir='{self.data_dir}', {counts})"
+
+
+# Store used when a model or helper is called without an explicit one
+_default_store = Store()
+
+
+def get_default_store():
+    """Return the process-wide store used when no store is passed."""
+    return _default_store
+
+
+def set_default_store(store: Store):
+    """Replace the process-wide default store and return the previous one."""
+    global _default_store
+    previous = _default_store
+    _default_store = store
+    return previous
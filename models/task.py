@@ -6,38 +6,34 @@
 """
 Task model definition.
 
-Represents a unit of work within a Project. Includes class-level storage,
+Represents a unit of work within a Project. Includes store registration,
 ID generation, controlled attribute access, relationship management,
 task completion tracking, and JSON serialization helpers.
 """
 
+from models.store import get_default_store
 from models.project import Project
 
 
 class Task:
-    # Class-level ID tracking and storage
-    _id_counter = 1
-    _tasks = []
-
-    def __init__(self, title: str, assigned_to: str, project_id: int, status: str = "pending"):
-        # Unique ID
-        self.id = Task._id_counter
-        Task._id_counter += 1
+    def __init__(self, title: str, assigned_to: str, project_id: int, status: str = "pending", store=None):
+        # The store that owns this task (process default if not given)
+        self._store = store or get_default_store()
 
         # Controlled attributes
         self.title = title
         self.assigned_to = assigned_to
         self.status = status  # "pending" or "completed"
 
+        # Register with the store, which assigns the unique ID
+        self._store.add("tasks", self)
+
         # Relationship: belongs to a project
         self.project_id = project_id
-        project = Project.get_by_id(project_id)
+        project = Project.get_by_id(project_id, store=self._store)
         if project:
             project.add_task(self)
 
-        # Store instance in class-level list
-        Task._tasks.append(self)
-
     # -------------------- PROPERTIES --------------------
     @property
     def title(self):
@@ -57,7 +53,7 @@ class Task:
     def assigned_to(self, value):
         if not value or not isinstance(value, str):
             raise ValueError("assigned_to must be a non-empty string.")
-        self._assigned_to = value
+        self._update_indexed("_assigned_to", value)
 
     @property
     def status(self):
@@ -68,12 +64,25 @@ class Task:
         allowed = ["pending", "completed"]
         if value not in allowed:
             raise ValueError("Status must be 'pending' or 'completed'.")
-        self._status = value
+        self._update_indexed("_status", value)
+
+    def _update_indexed(self, attr, value):
+        """Set an attribute the store's assignee index is keyed on."""
+        with self._store.lock:
+            old_assignee = getattr(self, "_assigned_to", None)
+            old_status = getattr(self, "_status", None)
+            setattr(self, attr, value)
+            # Only re-index once the task is registered (after __init__)
+            if hasattr(self, "id"):
+                self._store.reindex_task(self, old_assignee, old_status)
 
     # -------------------- BEHAVIOR METHODS --------------------
     def mark_complete(self):
-        """Mark this task as completed."""
-        self.status = "completed"
+        """Mark this task as completed (a no-op if it already is)."""
+        if self.status == "completed":
+            return
+        self.status = "completed"  # the setter updates the assignee index
+        self._store.emit("task.completed", self.to_dict())
 
     # -------------------- SERIALIZATION --------------------
     def to_dict(self):
@@ -87,29 +96,36 @@ class Task:
         }
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict, store=None):
         """Rebuild a Task object from stored data."""
         task = cls(
             data["title"],
             data["assigned_to"],
             data["project_id"],
             status=data["status"],
+            store=store,
         )
-        task.id = data["id"]
+        task._store.restore_id("tasks", task, data["id"])
         return task
 
     # -------------------- CLASS METHODS --------------------
     @classmethod
-    def get_all(cls):
-        return cls._tasks
+    def get_all(cls, store=None):
+        return (store or get_default_store()).all("tasks")
 
     @classmethod
-    def get_by_id(cls, task_id: int):
-        return next((t for t in cls._tasks if t.id == task_id), None)
+    def get_by_id(cls, task_id: int, store=None):
+        return (store or get_default_store()).get("tasks", task_id)
 
     @classmethod
-    def create(cls, title, assigned_to, project_id):
-        return cls(title, assigned_to, project_id)
+    def get_by_assignee(cls, assigned_to: str, status: str = None, store=None):
+        return (store or get_default_store()).tasks_for_assignee(assigned_to, status)
+
+    @classmethod
+    def create(cls, title, assigned_to, project_id, store=None):
+        task = cls(title, assigned_to, project_id, store=store)
+        task._store.emit("task.created", task.to_dict())
+        return task
 
     # -------------------- STRING REPRESENTATION --------------------
     def __repr__(self):
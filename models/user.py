@@ -7,19 +7,17 @@
 User model definition.
 
 Represents a system user who owns one or more projects. Includes
-class-level collections, controlled attribute access, ID generation,
+store registration, controlled attribute access, ID generation,
 relationship management, and JSON serialization helpers.
 """
 
-class User:
-    # Class-level attributes for ID generation and storage
-    _id_counter = 1
-    _users = []
+from models.store import get_default_store
+
 
-    def __init__(self, name: str, email: str):
-        # Assign unique ID from class counter
-        self.id = User._id_counter
-        User._id_counter += 1
+class User:
+    def __init__(self, name: str, email: str, store=None):
+        # The store that owns this user (process default if not given)
+        self._store = store or get_default_store()
 
         # Controlled attributes using property setters
         self.name = name
@@ -28,8 +26,8 @@ class User:
         # A user can have many projects (relationship: 1-to-many)
         self.projects = []
 
-        # Store instance in class-level list
-        User._users.append(self)
+        # Register with the store, which assigns the unique ID
+        self._store.add("users", self)
 
     # -------------------- PROPERTIES --------------------
     @property
@@ -60,33 +58,35 @@ class User:
     # -------------------- SERIALIZATION --------------------
     def to_dict(self):
         """Convert this User into a dictionary for JSON saving."""
+        # projects are relinked from each Project's user_id on load
         return {
             "id": self.id,
             "name": self.name,
             "email": self.email,
-            "projects": [p.id for p in self.projects]
         }
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict, store=None):
         """Reconstruct a User instance from saved dictionary data."""
-        user = cls(data["name"], data["email"])
-        user.id = data["id"]  # restore original ID
+        user = cls(data["name"], data["email"], store=store)
+        user._store.restore_id("users", user, data["id"])  # restore original ID
         return user
 
     # -------------------- CLASS METHODS --------------------
     @classmethod
-    def get_all(cls):
-        return cls._users
+    def get_all(cls, store=None):
+        return (store or get_default_store()).all("users")
 
     @classmethod
-    def get_by_id(cls, user_id: int):
-        return next((u for u in cls._users if u.id == user_id), None)
+    def get_by_id(cls, user_id: int, store=None):
+        return (store or get_default_store()).get("users", user_id)
 
     @classmethod
-    def create(cls, name, email):
+    def create(cls, name, email, store=None):
         """Factory method to create a User and return it immediately."""
-        return cls(name, email)
+        user = cls(name, email, store=store)
+        user._store.emit("user.created", user.to_dict())
+        return user
 
     # -------------------- STRING REPRESENTATION --------------------
     def __repr__(self):
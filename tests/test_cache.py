@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Tests for the generation-stamped query cache.
+"""
+
+import pytest
+
+from main import main
+from models.store import Store
+from models.user import User
+from utils import storage
+from utils.storage import read_generation
+
+
+def test_save_bumps_generation(tmp_path):
+    store = main(["--data-dir", str(tmp_path), "add-user",
+                  "--name", "Jo", "--email", "jo@example.com"])
+    assert store.generation == 1
+    main(["add-user", "--name", "Kim", "--email", "kim@example.com"], store=store)
+    assert read_generation(Store(str(tmp_path))) == 2
+
+
+def test_cache_hit_skips_loading(tmp_path, capsys):
+    data_dir = str(tmp_path)
+    main(["--data-dir", data_dir, "add-user", "--name", "Lee", "--email", "lee@example.com"])
+
+    main(["--data-dir", data_dir, "list-users"])  # miss: loads and caches
+    store = main(["--data-dir", data_dir, "list-users"])  # hit
+    assert not store.loaded
+    assert "lee@example.com" in capsys.readouterr().out
+
+    # a write bumps the generation, so the next list sees the new user
+    main(["--data-dir", data_dir, "add-user", "--name", "Max", "--email", "max@example.com"])
+    store = main(["--data-dir", data_dir, "list-users"])
+    assert store.loaded
+    assert "max@example.com" in capsys.readouterr().out
+
+
+def test_empty_result_is_a_cache_hit(tmp_path):
+    data_dir = str(tmp_path)
+    main(["--data-dir", data_dir, "list-tasks"])  # miss: caches no rows
+    store = main(["--data-dir", data_dir, "list-tasks"])
+    assert not store.loaded
+
+
+def test_generation_is_read_before_data_files(tmp_path, monkeypatch, capsys):
+    data_dir = str(tmp_path)
+    main(["--data-dir", data_dir, "add-user", "--name", "Ada", "--email", "ada@example.com"])
+
+    # another process saves user B right after the data files are read
+    real_load_records = storage.load_records
+    saved = []
+
+    def load_then_concurrent_save(path, *args, **kwargs):
+        records = real_load_records(path, *args, **kwargs)
+        if path.endswith(storage.TASKS_FILE) and not saved:
+            saved.append(True)
+            main(["--data-dir", data_dir, "add-user", "--name", "Bo", "--email", "bo@example.com"])
+        return records
+
+    monkeypatch.setattr(storage, "load_records", load_then_concurrent_save)
+    store = main(["--data-dir", data_dir, "list-users"])
+    monkeypatch.undo()
+
+    assert store.generation == 1  # rows reflect generation 1, not 2
+    assert read_generation(Store(data_dir)) == 2
+
+    # the next reader misses the cache and sees user B
+    capsys.readouterr()
+    main(["--data-dir", data_dir, "list-users"])
+    assert "bo@example.com" in capsys.readouterr().out
+
+
+def test_loaded_store_lists_unsaved_changes(tmp_path, capsys):
+    store = main(["--data-dir", str(tmp_path), "add-user", "--name", "Ana", "--email", "ana@example.com"])
+    main(["list-users"], store=store)
+    User.create("Ben", "ben@example.com", store=store)  # not saved yet
+    capsys.readouterr()
+
+    main(["list-users"], store=store)
+    assert "ben@example.com" in capsys.readouterr().out
+
+
+def test_unreadable_meta_is_an_error_not_generation_zero(tmp_path, capsys):
+    data_dir = str(tmp_path)
+    main(["--data-dir", data_dir, "add-user", "--name", "Cy", "--email", "cy@example.com"])
+    (tmp_path / storage.META_FILE).write_text("")
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit):
+        main(["--data-dir", data_dir, "list-users", "--plain"])
+    out = capsys.readouterr().out
+    assert "Warning" not in out and "meta.json" in out
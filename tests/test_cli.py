@@ -27,3 +27,37 @@ def test_cli_add_user():
 def test_cli_list_users():
     result = run_cli(["list-users"])
     assert result.returncode == 0
+
+
+def test_cli_list_tasks_plain_when_piped(tmp_path):
+    data_dir = ["--data-dir", str(tmp_path)]
+    run_cli(data_dir + ["add-user", "--name", "Pam", "--email", "pam@example.com"])
+    run_cli(data_dir + ["add-project", "--title", "P", "--description", "d",
+                        "--due", "2030-01-01", "--user-id", "1"])
+    run_cli(data_dir + ["add-task", "--title", "Write\tdocs", "--assigned-to", "Pam",
+                        "--project-id", "1"])
+
+    # stdout is a pipe here, so the plain renderer is used
+    result = run_cli(data_dir + ["list-tasks"])
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == [
+        "ID\tTitle\tAssigned To\tStatus\tProject ID",
+        "1\tWrite docs\tPam\tpending\t1",
+    ]
+
+
+def test_cli_my_tasks_and_workload(tmp_path):
+    data_dir = ["--data-dir", str(tmp_path)]
+    run_cli(data_dir + ["add-user", "--name", "Quinn", "--email", "quinn@example.com"])
+    run_cli(data_dir + ["add-project", "--title", "P", "--description", "d",
+                        "--due", "2030-01-01", "--user-id", "1"])
+    for title in ("A", "B"):
+        run_cli(data_dir + ["add-task", "--title", title, "--assigned-to", "quinn",
+                            "--project-id", "1"])
+    run_cli(data_dir + ["complete-task", "--task-id", "1"])
+
+    result = run_cli(data_dir + ["my-tasks", "--assigned-to", "quinn"])
+    assert result.stdout.splitlines()[1:] == ["2\tB\tquinn\tpending\t1"]
+
+    result = run_cli(data_dir + ["workload"])
+    assert result.stdout.splitlines()[1:] == ["quinn\t1\t1"]
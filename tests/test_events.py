@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Tests for change events and the watch command.
+"""
+
+import json
+import threading
+import time
+
+from main import main
+from models.store import Store
+from utils import storage
+
+
+def test_mutations_emit_numbered_events(tmp_path, capsys):
+    data_dir = str(tmp_path)
+    store = main(["--data-dir", data_dir, "add-user", "--name", "Rae", "--email", "rae@example.com"])
+    main(["add-project", "--title", "P", "--description", "d",
+          "--due", "2030-01-01", "--user-id", "1"], store=store)
+    main(["add-task", "--title", "T", "--assigned-to", "rae", "--project-id", "1"], store=store)
+    main(["complete-task", "--task-id", "1"], store=store)
+    capsys.readouterr()
+
+    watched = main(["--data-dir", data_dir, "watch", "--no-follow"])
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(e["seq"], e["event"]) for e in events] == [
+        (1, "user.created"),
+        (2, "project.created"),
+        (3, "task.created"),
+        (4, "task.completed"),
+    ]
+    assert events[3]["data"]["status"] == "completed"
+    assert not watched.loaded  # watching never loads the data files
+
+
+def test_watch_since_skips_seen_events(tmp_path, capsys):
+    data_dir = str(tmp_path)
+    for name in ("Sam", "Tia", "Uma"):
+        main(["--data-dir", data_dir, "add-user", "--name", name, "--email", f"{name}@example.com"])
+    capsys.readouterr()
+
+    main(["--data-dir", data_dir, "watch", "--since", "2", "--no-follow"])
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [e["data"]["name"] for e in events] == ["Uma"]
+
+
+def test_completing_twice_emits_one_event(tmp_path, capsys):
+    data_dir = str(tmp_path)
+    store = main(["--data-dir", data_dir, "add-user", "--name", "Val", "--email", "val@example.com"])
+    main(["add-project", "--title", "P", "--description", "d",
+          "--due", "2030-01-01", "--user-id", "1"], store=store)
+    main(["add-task", "--title", "T", "--assigned-to", "val", "--project-id", "1"], store=store)
+    main(["complete-task", "--task-id", "1"], store=store)
+    generation = store.generation
+    main(["complete-task", "--task-id", "1"], store=store)
+    assert store.generation == generation  # nothing changed, nothing saved
+    capsys.readouterr()
+
+    main(["--data-dir", data_dir, "watch", "--no-follow"])
+    events = [json.loads(line)["event"] for line in capsys.readouterr().out.splitlines()]
+    assert events.count("task.completed") == 1
+
+
+def test_watch_reads_rotated_file_and_skips_bad_lines(tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(storage, "EVENTS_MAX_BYTES", 1)  # rotate before every append
+    data_dir = str(tmp_path)
+    for name in ("Wes", "Xia"):
+        main(["--data-dir", data_dir, "add-user", "--name", name, "--email", f"{name}@example.com"])
+    with open(tmp_path / storage.EVENTS_FILE, "a") as file:
+        file.write("not json\n")
+    capsys.readouterr()
+
+    main(["--data-dir", data_dir, "watch", "--no-follow"])
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [e["data"]["name"] for e in events] == ["Wes", "Xia"]
+
+
+def test_sequence_survives_a_missing_meta_file(tmp_path, capsys):
+    data_dir = str(tmp_path)
+    for name in ("Zed", "Ari"):
+        main(["--data-dir", data_dir, "add-user", "--name", name, "--email", f"{name}@example.com"])
+    # e.g. a save that appended its events but stopped before writing meta
+    (tmp_path / storage.META_FILE).unlink()
+    main(["--data-dir", data_dir, "add-user", "--name", "Bea", "--email", "bea@example.com"])
+    capsys.readouterr()
+
+    main(["--data-dir", data_dir, "watch", "--since", "2", "--no-follow"])
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(e["seq"], e["data"]["name"]) for e in events] == [(3, "Bea")]
+
+
+def test_following_watch_does_not_block_the_store(tmp_path, capsys):
+    store = Store(str(tmp_path))
+    watcher = threading.Thread(
+        target=main,
+        args=(["watch", "--interval", "0.05"],),
+        kwargs={"store": store},
+        daemon=True,  # follows forever; dies with the test process
+    )
+    watcher.start()
+
+    writer = threading.Thread(
+        target=main,
+        args=(["add-user", "--name", "Yan", "--email", "yan@example.com"],),
+        kwargs={"store": store},
+        daemon=True,  # so a regression fails the test instead of hanging it
+    )
+    writer.start()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+
+    # wait for the watcher to print the event, so it cannot leak into
+    # the output captured by a later test
+    out, deadline = "", time.time() + 5
+    while "yan@example.com" not in out and time.time() < deadline:
+        time.sleep(0.05)
+        out += capsys.readouterr().out
+    events = [json.loads(line) for line in out.splitlines() if line.startswith("{")]
+    assert [e["event"] for e in events] == ["user.created"]
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Tests for the streaming export command.
+"""
+
+import csv
+import gzip
+import json
+
+from main import main
+
+
+def make_store(data_dir):
+    store = main(["--data-dir", data_dir, "add-user", "--name", "Nia", "--email", "nia@example.com"])
+    main(["add-project", "--title", "Site", "--description", "d",
+          "--due", "2030-01-01", "--user-id", "1"], store=store)
+    main(["add-task", "--title", "Deploy", "--assigned-to", "Nia", "--project-id", "1"], store=store)
+    return store
+
+
+def test_export_jsonl_gzip(tmp_path):
+    store = make_store(str(tmp_path))
+    out = tmp_path / "export.jsonl.gz"
+    main(["export", "--output", str(out)], store=store)
+
+    with gzip.open(out, "rt") as file:
+        rows = [json.loads(line) for line in file]
+    assert rows == [{
+        "task_id": 1, "task_title": "Deploy", "assigned_to": "Nia",
+        "status": "pending", "project_id": 1, "project_title": "Site",
+        "project_due_date": "2030-01-01", "user_id": 1,
+        "user_name": "Nia", "user_email": "nia@example.com",
+    }]
+
+
+def test_export_csv_to_stdout(tmp_path, capsys):
+    store = make_store(str(tmp_path))
+    capsys.readouterr()
+    main(["export", "--format", "csv"], store=store)
+
+    rows = list(csv.DictReader(capsys.readouterr().out.splitlines()))
+    assert rows[0]["task_title"] == "Deploy"
+    assert rows[0]["user_email"] == "nia@example.com"
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Tests for the versioned storage schema and the fsck command.
+"""
+
+import json
+
+import pytest
+
+from main import main
+from models.store import Store
+from models.user import User
+from utils.storage import SCHEMA_VERSION, load_all
+from utils.integrity import check_integrity, check_store_files
+
+
+def test_v1_files_are_upgraded_on_load(tmp_path):
+    (tmp_path / "users.json").write_text(json.dumps(
+        [{"id": 3, "name": "Omar", "email": "omar@example.com", "projects": [7]}]
+    ))
+    (tmp_path / "projects.json").write_text(json.dumps(
+        [{"id": 7, "title": "P", "description": "d", "due_date": "2030-01-01",
+          "user_id": 3, "tasks": []}]
+    ))
+
+    store = load_all(Store(str(tmp_path)))
+    assert [p.id for p in User.get_by_id(3, store=store).projects] == [7]
+
+    upgraded = json.loads((tmp_path / "users.json").read_text())
+    assert upgraded == {
+        "schema": SCHEMA_VERSION,
+        "records": [{"id": 3, "name": "Omar", "email": "omar@example.com"}],
+    }
+
+
+def test_check_integrity_reports_problems():
+    users = [{"id": 1}, {"id": 1}]
+    projects = [{"id": 1, "user_id": 1}, {"id": 2, "user_id": 9}]
+    tasks = [{"id": 1, "project_id": 2}, {"id": 2, "project_id": 5}]
+
+    assert check_integrity(users, projects, tasks) == [
+        "Duplicate user ID 1",
+        "Project 2 references missing user 9",
+        "Task 2 references missing project 5",
+    ]
+
+
+def test_fsck_command_exit_status(tmp_path):
+    main(["--data-dir", str(tmp_path), "fsck"])  # empty store is consistent
+
+    (tmp_path / "tasks.json").write_text(json.dumps(
+        {"schema": SCHEMA_VERSION, "records": [
+            {"id": 1, "title": "T", "assigned_to": "x", "status": "pending", "project_id": 4}
+        ]}
+    ))
+    with pytest.raises(SystemExit):
+        main(["--data-dir", str(tmp_path), "fsck"])
+
+
+def test_corrupted_file_is_never_rewritten(tmp_path):
+    main(["--data-dir", str(tmp_path), "add-user", "--name", "Vic", "--email", "vic@example.com"])
+    users_file = tmp_path / "users.json"
+    truncated = users_file.read_text()[:-5]
+    users_file.write_text(truncated)
+
+    for command in (["export"], ["add-user", "--name", "W", "--email", "w@example.com"]):
+        with pytest.raises(SystemExit):
+            main(["--data-dir", str(tmp_path)] + command)
+    assert users_file.read_text() == truncated
+
+    with pytest.raises(SystemExit):
+        main(["--data-dir", str(tmp_path), "fsck"])
+    assert check_store_files(Store(str(tmp_path)))[0].startswith(str(users_file))
+
+
+@pytest.mark.parametrize("contents, commands", [
+    ({"schema": 2, "records": [1, 2]}, ["list-users", "fsck"]),
+    ({"schema": "2", "records": []}, ["list-users", "fsck"]),
+    ({"schema": 0, "records": []}, ["list-users", "fsck"]),
+    ({"schema": 2, "records": [{"id": 1}]}, ["list-users"]),
+])
+def test_malformed_files_are_reported_not_crashed_on(tmp_path, contents, commands):
+    (tmp_path / "users.json").write_text(json.dumps(contents))
+
+    for command in commands:
+        with pytest.raises(SystemExit):
+            main(["--data-dir", str(tmp_path), command])
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Tests for the Store and the in-process CLI entry point.
+"""
+
+import threading
+
+import pytest
+
+from main import main
+from models.store import Store
+from models.user import User
+from models.project import Project
+from utils.storage import StaleStoreError, load_all, save_all
+
+
+def test_stores_are_independent():
+    a = Store("unused-a")
+    b = Store("unused-b")
+    ua = User("Gina", "gina@example.com", store=a)
+    Project("Only in A", "desc", "2030-01-01", ua.id, store=a)
+
+    assert User.get_all(a) == [ua]
+    assert User.get_all(b) == []
+    assert Project.get_by_id(1, store=a).title == "Only in A"
+    assert Project.get_by_id(1, store=b) is None
+
+
+def test_main_in_process_reuses_store(tmp_path, capsys):
+    store = Store(str(tmp_path))
+    main(["add-user", "--name", "Hank", "--email", "hank@example.com"], store=store)
+    main(["add-project", "--title", "P", "--description", "d",
+          "--due", "2030-01-01", "--user-id", "1"], store=store)
+
+    assert "Project created" in capsys.readouterr().out
+    assert User.get_by_id(1, store=store).projects[0].title == "P"
+
+    # a fresh store reading the same directory sees the saved data
+    reloaded = load_all(Store(str(tmp_path)))
+    assert [p.title for p in Project.get_all(reloaded)] == ["P"]
+
+
+def test_concurrent_creates_get_unique_ids(tmp_path):
+    store = Store(str(tmp_path))
+
+    def worker(n):
+        for i in range(50):
+            User.create(f"user{n}-{i}", f"u{n}-{i}@example.com", store=store)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    ids = [u.id for u in User.get_all(store)]
+    assert sorted(ids) == list(range(1, 201))
+
+
+def test_reused_store_picks_up_other_writers(tmp_path):
+    data_dir = str(tmp_path)
+    worker = main(["--data-dir", data_dir, "add-user", "--name", "A", "--email", "a@example.com"])
+    main(["--data-dir", data_dir, "add-user", "--name", "C", "--email", "c@example.com"])
+    main(["add-user", "--name", "D", "--email", "d@example.com"], store=worker)
+
+    reloaded = load_all(Store(data_dir))
+    assert [(u.id, u.name) for u in User.get_all(reloaded)] == [(1, "A"), (2, "C"), (3, "D")]
+
+
+def test_save_refuses_to_overwrite_newer_data(tmp_path):
+    data_dir = str(tmp_path)
+    worker = main(["--data-dir", data_dir, "add-user", "--name", "A", "--email", "a@example.com"])
+    User.create("B", "b@example.com", store=worker)  # unsaved change
+    main(["--data-dir", data_dir, "add-user", "--name", "C", "--email", "c@example.com"])
+
+    with pytest.raises(StaleStoreError):
+        save_all(worker)
+    assert [u.name for u in User.get_all(load_all(Store(data_dir)))] == ["A", "C"]
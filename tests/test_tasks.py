@@ -10,6 +10,7 @@ Unit tests for the Task model.
 
 from models.user import User
 from models.project import Project
+from models.store import Store
 from models.task import Task
 
 
@@ -31,3 +32,30 @@ def test_mark_complete():
 
     t.mark_complete()
     assert t.status == "completed"
+
+
+def test_assignee_index_tracks_status():
+    store = Store("unused")
+    u = User("Gail", "gail@example.com", store=store)
+    p = Project("Proj", "d", "2030-01-01", u.id, store=store)
+    t1 = Task("One", "gail", p.id, store=store)
+    t2 = Task("Two", "gail", p.id, store=store)
+    Task("Three", "hugo", p.id, store=store)
+
+    t1.mark_complete()
+    assert Task.get_by_assignee("gail", "pending", store=store) == [t2]
+    assert Task.get_by_assignee("gail", "completed", store=store) == [t1]
+    assert store.workload() == [("gail", 1, 1), ("hugo", 1, 0)]
+
+
+def test_setters_keep_assignee_index_current():
+    store = Store("unused")
+    u = User("Ida", "ida@example.com", store=store)
+    p = Project("Proj", "d", "2030-01-01", u.id, store=store)
+    t = Task("One", "ida", p.id, store=store)
+
+    t.assigned_to = "jon"
+    t.status = "completed"
+    assert Task.get_by_assignee("ida", store=store) == []
+    assert Task.get_by_assignee("jon", "completed", store=store) == [t]
+    assert store.workload() == [("jon", 0, 1)]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+On-disk cache for list and query results.
+
+Entries hold the already-formatted rows of a command and are keyed by
+the command name, its arguments, and the store generation. Because every
+`save_all` bumps the generation, a write makes older entries unreachable
+and they are removed the next time a result is cached.
+"""
+
+import hashlib
+import json
+import os
+
+from utils.storage import current_generation
+
+# Cache folder inside each store's data directory
+CACHE_DIR = ".cache"
+
+
+def cache_dir(store):
+    """Return the cache directory for a store."""
+    return os.path.join(store.data_dir, CACHE_DIR)
+
+
+def cache_key(command, params, generation):
+    """Build a stable file name for a command, its arguments, and a generation."""
+    payload = json.dumps([command, params], sort_keys=True)
+    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    return f"{generation}-{digest}.json"
+
+
+def get_cached_rows(store, command, params):
+    """Return cached rows for the current generation, or None on a miss."""
+    key = cache_key(command, params, current_generation(store))
+    try:
+        with open(os.path.join(cache_dir(store), key), "r") as file:
+            return json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return None  # no entry yet, or pruned/damaged: rebuild it
+
+
+def put_cached_rows(store, command, params, rows):
+    """Cache rows for the current generation and prune stale entries."""
+    generation = current_generation(store)
+    directory = cache_dir(store)
+    os.makedirs(directory, exist_ok=True)
+
+    # Entries from other generations can never be hit again
+    prefix = f"{generation}-"
+    for name in os.listdir(directory):
+        if not name.startswith(prefix) and not name.endswith(".tmp"):
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass  # another process pruned it first
+
+    # Write to a temporary file first so readers never see partial JSON
+    path = os.path.join(directory, cache_key(command, params, generation))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(rows, file)
+    os.replace(tmp_path, path)
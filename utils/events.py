@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Reading the change feed.
+
+Model mutations queue change events on their store, and `save_all`
+appends them to the events file as numbered JSON lines, rotating it
+once it grows past a size limit. This module tails that file (and the
+rotated one) so consumers can react to changes without loading any of
+the data files.
+"""
+
+import json
+import os
+import time
+
+from utils.storage import EVENTS_FILE, ROTATED_SUFFIX, data_path
+
+
+def events_path(store):
+    """Return the path of the store's events file."""
+    return data_path(store, EVENTS_FILE)
+
+
+def read_events(path, position=0):
+    """
+    Return (events, new position) for the complete lines after `position`.
+
+    A trailing line without a newline is still being written and is left
+    for the next read. Malformed lines are skipped.
+    """
+    events = []
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return events, position
+
+    with file:
+        file.seek(position)
+        while True:
+            line = file.readline()
+            if not line.endswith(b"\n"):
+                break
+            position += len(line)
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and isinstance(event.get("seq"), int):
+                events.append(event)
+    return events, position
+
+
+def follow_events(path, since=0, follow=True, interval=0.5):
+    """
+    Yield events with a sequence number greater than `since`.
+
+    Events kept in the rotated file are read first. With `follow` the
+    generator keeps polling the file for appended lines, like
+    `tail -F`; otherwise it stops at the end of the file.
+    """
+    rotated = path + ROTATED_SUFFIX
+    pending, _ = read_events(rotated)
+    position, inode = 0, None
+
+    while True:
+        try:
+            current = os.stat(path).st_ino
+        except FileNotFoundError:
+            current = None
+
+        if inode is not None and current != inode:
+            # The file we were reading was rotated: finish it, then restart
+            events, _ = read_events(rotated, position)
+            pending.extend(events)
+            position = 0
+        inode = current
+
+        if current is not None:
+            events, position = read_events(path, position)
+            pending.extend(events)
+
+        for event in pending:
+            if event["seq"] > since:
+                since = event["seq"]
+                yield event
+        pending = []
+
+        if not follow:
+            return
+        time.sleep(interval)
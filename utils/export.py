@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Streaming export of the store as denormalized rows.
+
+Each row is a task joined with its project and that project's owner.
+Rows are produced one at a time from the store's indexes and written
+straight to the target (a file or stdout) as JSONL or CSV, optionally
+gzip-compressed, so memory use does not grow with the export size.
+"""
+
+import contextlib
+import csv
+import gzip
+import io
+import json
+import sys
+
+from models.user import User
+from models.project import Project
+from models.task import Task
+
+EXPORT_FORMATS = ("jsonl", "csv")
+
+# Column order shared by both formats
+EXPORT_FIELDS = [
+    "task_id",
+    "task_title",
+    "assigned_to",
+    "status",
+    "project_id",
+    "project_title",
+    "project_due_date",
+    "user_id",
+    "user_name",
+    "user_email",
+]
+
+
+def export_rows(store=None):
+    """Yield one dict per task, joined with its project and user."""
+    for task in Task.get_all(store):
+        project = Project.get_by_id(task.project_id, store=store)
+        user = User.get_by_id(project.user_id, store=store) if project else None
+        yield {
+            "task_id": task.id,
+            "task_title": task.title,
+            "assigned_to": task.assigned_to,
+            "status": task.status,
+            "project_id": task.project_id,
+            "project_title": project.title if project else None,
+            "project_due_date": project.due_date if project else None,
+            "user_id": project.user_id if project else None,
+            "user_name": user.name if user else None,
+            "user_email": user.email if user else None,
+        }
+
+
+@contextlib.contextmanager
+def open_export_target(path, compress=False):
+    """
+    Open a text stream for the export.
+
+    A path of None or "-" means stdout, which is flushed but never closed.
+    """
+    to_stdout = path in (None, "-")
+    if not compress:
+        if to_stdout:
+            yield sys.stdout
+            sys.stdout.flush()
+        else:
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                yield file
+        return
+
+    if to_stdout:
+        # GzipFile leaves a fileobj it did not open untouched on close
+        raw = gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb")
+    else:
+        raw = gzip.open(path, "wb")
+    with io.TextIOWrapper(raw, encoding="utf-8", newline="") as file:
+        yield file
+    if to_stdout:
+        sys.stdout.buffer.flush()
+
+
+def write_jsonl(rows, stream):
+    """Write rows as one compact JSON object per line; return the count."""
+    count = 0
+    for row in rows:
+        stream.write(json.dumps(row, separators=(",", ":")))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(rows, stream):
+    """Write rows as CSV with a header line; return the count."""
+    writer = csv.DictWriter(stream, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def export_store(store=None, fmt="jsonl", path=None, compress=False):
+    """Stream every task row of the store to `path`; return the row count."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Export format must be one of: {', '.join(EXPORT_FORMATS)}.")
+    writer = write_jsonl if fmt == "jsonl" else write_csv
+    with open_export_target(path, compress) as stream:
+        return writer(export_rows(store), stream)
@@ -13,26 +13,26 @@ from models.user import User
 from models.project import Project
 
 
-def find_user_or_error(user_id, console):
+def find_user_or_error(user_id, console, store=None):
     """
     Return a User if found.
 
     Otherwise print an error to the provided console and return None.
     """
-    user = User.get_by_id(user_id)
+    user = User.get_by_id(user_id, store=store)
     if not user:
         console.print(f"[bold red]Error: No user found with ID {user_id}[/]")
         return None
     return user
 
 
-def find_project_or_error(project_id, console):
+def find_project_or_error(project_id, console, store=None):
     """
     Return a Project if found.
 
     Otherwise print an error to the provided console and return None.
     """
-    project = Project.get_by_id(project_id)
+    project = Project.get_by_id(project_id, store=store)
     if not project:
         console.print(f"[bold red]Error: No project found with ID {project_id}[/]")
         return None
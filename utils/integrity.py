@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# Author
+# Date: 12/9/25
+# Version 1.1
+
+"""
+Referential integrity checks for the stored data.
+
+Works on the raw records rather than on the models, so problems that
+loading would hide (such as a duplicate ID overwriting an index entry)
+are still reported. Every record is visited exactly once.
+"""
+
+from utils.storage import (
+    USERS_FILE,
+    PROJECTS_FILE,
+    TASKS_FILE,
+    DataFileError,
+    data_path,
+    load_records,
+)
+
+
+def _check_ids(kind, records, problems):
+    """Collect the IDs of `records`, reporting duplicates along the way."""
+    seen = set()
+    for record in records:
+        record_id = record.get("id")
+        if record_id in seen:
+            problems.append(f"Duplicate {kind} ID {record_id}")
+        seen.add(record_id)
+    return seen
+
+
+def check_integrity(users, projects, tasks):
+    """Return a list of human-readable problems found in the records."""
+    problems = []
+    user_ids = _check_ids("user", users, problems)
+    project_ids = _check_ids("project", projects, problems)
+    _check_ids("task", tasks, problems)
+
+    for project in projects:
+        if project.get("user_id") not in user_ids:
+            problems.append(
+                f"Project {project.get('id')} references missing user {project.get('user_id')}"
+            )
+    for task in tasks:
+        if task.get("project_id") not in project_ids:
+            problems.append(
+                f"Task {task.get('id')} references missing project {task.get('project_id')}"
+            )
+    return problems
+
+
+def check_store_files(store):
+    """
+    Read the store's data files (without rewriting them) and check them.
+
+    Unreadable or corrupted files are reported as problems; the
+    relationship checks only run once every file could be decoded.
+    """
+    problems = []
+    collections = []
+    for name in (USERS_FILE, PROJECTS_FILE, TASKS_FILE):
+        try:
+            collections.append(load_records(data_path(store, name), upgrade=False))
+        except DataFileError as error:
+            problems.append(str(error))
+
+    if problems:
+        return problems
+    return check_integrity(*collections)
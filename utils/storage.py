@@ -9,113 +9,381 @@ Provides a clean separation between file I/O logic and the rest of the
 application. Supports saving and loading Users, Projects, and Tasks by
 serializing model instances into dictionaries and reconstructing them
 from stored JSON data.
+
+A small meta file records the store's generation, a counter bumped by
+every `save_all`. It can be read without loading any model, which is
+what the query cache in utils/cache.py relies on. It also holds the
+sequence number of the last change event appended to the events file
+(see utils/events.py).
+
+Data files use a versioned schema: `{"schema": N, "records": [...]}`
+written with compact separators. Version 1 files (a bare list whose
+users and projects carried redundant `projects`/`tasks` id lists) are
+upgraded in place the first time they are loaded.
 """
 
 import json
 import os
 
+from models.store import get_default_store
 from models.user import User
 from models.project import Project
 from models.task import Task
 
 
-# -------------------- FILE PATHS --------------------
-DATA_DIR = "data"
+# -------------------- FILE NAMES --------------------
+# Each store keeps these files inside its own data directory
+USERS_FILE = "users.json"
+PROJECTS_FILE = "projects.json"
+TASKS_FILE = "tasks.json"
+META_FILE = "meta.json"
+EVENTS_FILE = "events.jsonl"
+
+# When the events file reaches this size it is rotated to ROTATED_EVENTS_FILE
+# (replacing the previous one), so the tailed file stays small.
+EVENTS_MAX_BYTES = 1024 * 1024
+ROTATED_SUFFIX = ".1"
+ROTATED_EVENTS_FILE = EVENTS_FILE + ROTATED_SUFFIX
+
+# -------------------- SCHEMA --------------------
+SCHEMA_VERSION = 2
+
+# Compact JSON encoding used for every file we write
+SEPARATORS = (",", ":")
+
 
-USERS_FILE = os.path.join(DATA_DIR, "users.json")
-PROJECTS_FILE = os.path.join(DATA_DIR, "projects.json")
-TASKS_FILE = os.path.join(DATA_DIR, "tasks.json")
+def data_path(store, filename):
+    """Return the full path of a data file inside the store's directory."""
+    return os.path.join(store.data_dir, filename)
+
+
+class DataFileError(ValueError):
+    """Raised when a data file exists but cannot be read or decoded."""
+
+
+class StaleStoreError(ValueError):
+    """Raised when saving a loaded store whose files were changed by another writer."""
 
 
 # -------------------- GENERIC JSON HELPERS --------------------
-def load_json(path):
-    """Load JSON data from a file. If the file does not exist, return an empty list."""
-    if not os.path.exists(path):
-        return []
+def read_json(path):
+    """
+    Decode a JSON file, returning None if it does not exist.
+
+    Raises DataFileError if the file is unreadable or corrupted, so a
+    damaged file is never mistaken for an empty one.
+    """
     try:
         with open(path, "r") as file:
             return json.load(file)
-    except json.JSONDecodeError:
-        print(f"Warning: {path} is corrupted. Starting with empty data.")
-        return []
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise DataFileError(f"{path} is corrupted or unreadable ({error}).") from error
 
 
 def save_json(path, data):
-    """Save Python data (list/dict) into a JSON file."""
-    with open(path, "w") as file:
-        json.dump(data, file, indent=4)
+    """Save Python data (list/dict) into a compact JSON file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Write to a temporary file first so readers never see partial JSON
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(data, file, separators=SEPARATORS)
+    os.replace(tmp_path, path)
+
+
+# -------------------- VERSIONED RECORD FILES --------------------
+def _upgrade_v1(record):
+    """Drop the id lists that are derivable from the foreign keys."""
+    record.pop("projects", None)
+    record.pop("tasks", None)
+    return record
+
+
+# Upgrade step that turns a record of version N into version N + 1
+UPGRADES = {
+    1: _upgrade_v1,
+}
+
+
+def decode_records(data, path):
+    """
+    Return (records, version) for decoded file contents.
+
+    A bare list is a version 1 file; anything newer is a dict with
+    "schema" and "records" keys. Anything else, an unknown schema, or a
+    record that is not an object raises DataFileError.
+    """
+    if isinstance(data, list):
+        records, version = data, 1
+    elif isinstance(data, dict) and isinstance(data.get("records"), list):
+        records, version = data["records"], data.get("schema")
+    else:
+        raise DataFileError(f"{path} is not a recognized data file.")
+
+    if type(version) is not int or not 1 <= version <= SCHEMA_VERSION:
+        raise DataFileError(
+            f"{path} has unsupported schema {version!r} "
+            f"(expected 1 to {SCHEMA_VERSION})."
+        )
+    for position, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise DataFileError(f"{path} record {position} is not an object.")
+    return records, version
+
+
+def upgrade_records(records, version):
+    """Apply every upgrade step from `version` up to the current schema."""
+    while version < SCHEMA_VERSION:
+        step = UPGRADES[version]
+        records = [step(record) for record in records]
+        version += 1
+    return records
+
+
+def save_records(path, records):
+    """Save model records using the current schema."""
+    save_json(path, {"schema": SCHEMA_VERSION, "records": records})
+
+
+def load_records(path, upgrade=True):
+    """
+    Load model records from a data file.
+
+    A missing file has no records. A corrupted one raises DataFileError
+    and is left untouched. Old files that decoded cleanly are upgraded
+    to the current schema and, when `upgrade` is true, rewritten in
+    place. The data itself does not change, so the store generation is
+    left alone.
+    """
+    data = read_json(path)
+    if data is None:
+        return []
+    records, version = decode_records(data, path)
+    if version == SCHEMA_VERSION:
+        return records
+    records = upgrade_records(records, version)
+    if upgrade:
+        save_records(path, records)
+    return records
+
+
+# -------------------- GENERATION --------------------
+def read_meta(store):
+    """
+    Return the store's meta dict (generation and last event sequence).
+
+    A missing file means a fresh store. A file that exists but cannot be
+    decoded raises DataFileError rather than silently restarting the
+    counters at 0.
+    """
+    path = data_path(store, META_FILE)
+    meta = read_json(path)
+    if meta is None:
+        meta = {}
+    if not isinstance(meta, dict):
+        raise DataFileError(f"{path} is not a recognized meta file.")
+
+    result = {
+        "generation": meta.get("generation", 0),
+        "event_seq": meta.get("event_seq", 0),
+    }
+    if not all(type(value) is int for value in result.values()):
+        raise DataFileError(f"{path} has invalid counters.")
+    return result
+
+
+def read_generation(store):
+    """Return the saved generation of the store's data directory (0 if none)."""
+    return read_meta(store)["generation"]
+
+
+def current_generation(store):
+    """Return the generation of a loaded store, or read it from disk."""
+    if store.loaded:
+        return store.generation
+    return read_generation(store)
+
+
+# -------------------- CHANGE EVENTS --------------------
+# Bytes read from the end of an events file to find its last sequence
+EVENTS_TAIL_BYTES = 64 * 1024
+
+
+def _last_seq_in(path):
+    """Return the highest sequence number near the end of an events file."""
+    try:
+        with open(path, "rb") as file:
+            file.seek(max(0, os.path.getsize(path) - EVENTS_TAIL_BYTES))
+            lines = file.read().splitlines()
+    except OSError:
+        return 0
+
+    for line in reversed(lines):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue  # partial or damaged line
+        if isinstance(event, dict) and type(event.get("seq")) is int:
+            return event["seq"]
+    return 0
+
+
+def last_event_seq(store):
+    """
+    Return the last sequence number written to the events files.
+
+    Used alongside the meta file, so sequences keep increasing even if
+    meta.json was removed or a save stopped between appending events and
+    writing the meta.
+    """
+    return _last_seq_in(data_path(store, EVENTS_FILE)) or _last_seq_in(
+        data_path(store, ROTATED_EVENTS_FILE)
+    )
+
+
+def append_events(store, last_seq):
+    """
+    Number the store's pending events after `last_seq` and append them
+    to the events file as JSON lines. Returns the last sequence number.
+    """
+    if not store.pending_events:
+        return last_seq
+
+    lines = []
+    for event in store.pending_events:
+        last_seq += 1
+        record = {"seq": last_seq, **event}
+        lines.append(json.dumps(record, separators=SEPARATORS) + "\n")
+
+    path = data_path(store, EVENTS_FILE)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.exists(path) and os.path.getsize(path) >= EVENTS_MAX_BYTES:
+        os.replace(path, data_path(store, ROTATED_EVENTS_FILE))
+    with open(path, "a") as file:
+        file.writelines(lines)
+    store.pending_events = []
+    return last_seq
 
 
 # -------------------- SAVE FUNCTIONS --------------------
-def save_users():
+def save_users(store=None):
     """Convert all user objects to dictionaries and save them to JSON."""
-    data = [u.to_dict() for u in User.get_all()]
-    save_json(USERS_FILE, data)
+    store = store or get_default_store()
+    data = [u.to_dict() for u in User.get_all(store)]
+    save_records(data_path(store, USERS_FILE), data)
 
 
-def save_projects():
+def save_projects(store=None):
     """Convert all project objects to dictionaries and save them to JSON."""
-    data = [p.to_dict() for p in Project.get_all()]
-    save_json(PROJECTS_FILE, data)
+    store = store or get_default_store()
+    data = [p.to_dict() for p in Project.get_all(store)]
+    save_records(data_path(store, PROJECTS_FILE), data)
 
 
-def save_tasks():
+def save_tasks(store=None):
     """Convert all task objects to dictionaries and save them to JSON."""
-    data = [t.to_dict() for t in Task.get_all()]
-    save_json(TASKS_FILE, data)
-
-
-def save_all():
-    """Convenience helper to save everything at once."""
-    save_users()
-    save_projects()
-    save_tasks()
+    store = store or get_default_store()
+    data = [t.to_dict() for t in Task.get_all(store)]
+    save_records(data_path(store, TASKS_FILE), data)
+
+
+def save_all(store=None):
+    """
+    Convenience helper to save everything at once.
+
+    Pending change events are appended, and the generation bumped, only
+    after every data file has been written.
+
+    A loaded store is only saved if nobody else has saved since it was
+    loaded; otherwise writing it would silently drop their changes, so
+    StaleStoreError is raised instead.
+    """
+    store = store or get_default_store()
+    with store.lock:
+        meta = read_meta(store)
+        if store.loaded and meta["generation"] != store.generation:
+            raise StaleStoreError(
+                f"Data in {store.data_dir} was changed by another writer "
+                f"(generation {meta['generation']}, loaded {store.generation}). "
+                "Reload and retry."
+            )
+
+        save_users(store)
+        save_projects(store)
+        save_tasks(store)
+
+        last_seq = max(store.event_seq, meta["event_seq"], last_event_seq(store))
+        store.event_seq = append_events(store, last_seq)
+        store.generation = max(store.generation, meta["generation"]) + 1
+        save_json(
+            data_path(store, META_FILE),
+            {"generation": store.generation, "event_seq": store.event_seq},
+        )
+        store.dirty = False
 
 
 # -------------------- LOAD FUNCTIONS --------------------
-def load_users():
+# Each loader expects the store's collection to be empty (see load_all).
+def _load_models(store, filename, model):
+    """Rebuild `model` instances, reporting bad records as DataFileError."""
+    path = data_path(store, filename)
+    for entry in load_records(path):
+        try:
+            model.from_dict(entry, store=store)
+        except (KeyError, TypeError, ValueError) as error:
+            raise DataFileError(
+                f"{path} has an invalid record {entry.get('id')!r} ({error!r})."
+            ) from error
+
+
+def load_users(store=None):
     """Load user dictionaries from JSON and rebuild User instances."""
-    data = load_json(USERS_FILE)
-
-    # Reset class-level data before loading
-    User._users = []
-    User._id_counter = 1
+    _load_models(store or get_default_store(), USERS_FILE, User)
 
-    for entry in data:
-        user = User.from_dict(entry)
-        # maintain highest ID
-        if user.id >= User._id_counter:
-            User._id_counter = user.id + 1
 
-
-def load_projects():
+def load_projects(store=None):
     """Load project dictionaries from JSON and rebuild Project instances."""
-    data = load_json(PROJECTS_FILE)
-
-    Project._projects = []
-    Project._id_counter = 1
-
-    for entry in data:
-        project = Project.from_dict(entry)
-        if project.id >= Project._id_counter:
-            Project._id_counter = project.id + 1
+    _load_models(store or get_default_store(), PROJECTS_FILE, Project)
 
 
-def load_tasks():
+def load_tasks(store=None):
     """Load task dictionaries from JSON and rebuild Task instances."""
-    data = load_json(TASKS_FILE)
-
-    Task._tasks = []
-    Task._id_counter = 1
-
-    for entry in data:
-        task = Task.from_dict(entry)
-        if task.id >= Task._id_counter:
-            Task._id_counter = task.id + 1
+    _load_models(store or get_default_store(), TASKS_FILE, Task)
 
 
-def load_all():
+def load_all(store=None):
     """Convenience helper to load everything in the correct order."""
-    load_users()
-    load_projects()
-    load_tasks()
+    store = store or get_default_store()
+    with store.lock:
+        # Read the generation before the data files: if another process
+        # saves in between, rows built from this load are cached under the
+        # older generation and can never mask the newer data.
+        meta = read_meta(store)
+
+        # Reset store data before loading
+        store.reset()
+        load_users(store)
+        load_projects(store)
+        load_tasks(store)
+        store.generation = meta["generation"]
+        store.event_seq = meta["event_seq"]
+        store.loaded = True
+        store.dirty = False
+    return store
+
+
+def ensure_loaded(store=None):
+    """
+    Load the store from disk unless it is loaded and up to date.
+
+    A loaded store is reloaded when another writer has saved since, so a
+    long-lived store keeps working on current data. A store with unsaved
+    changes is left alone; `save_all` refuses to write it over newer data.
+    """
+    store = store or get_default_store()
+    with store.lock:
+        stale = store.loaded and read_generation(store) != store.generation
+        if not store.loaded or (stale and not store.dirty):
+            load_all(store)
+    return store